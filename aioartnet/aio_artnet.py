@@ -1,11 +1,9 @@
 import asyncio
-import ipaddress
 import logging
 import re
 import socket
 import struct
 import time
-from collections import defaultdict
 from typing import Any, Optional, Tuple, Union, cast
 
 from .network import AF_PACKET, getifaddrs
@@ -32,26 +30,52 @@ SIOCGIFNETMASK = 0x891B
 SIOCGIFBRDADDR = 0x8919
 SIOCGIFFLAGS = 0x8913
 
+# requested receive buffer, so bursts of ArtDmx across many universes are not
+# dropped between event loop wakeups. The kernel may clamp this (rmem_max)
+SOCKET_RCVBUF = 1 << 20
+
 # interfaces *with an ip* are preferred in this order
 PREFERED_INTERFACES_ORDER = ["enp.*", "wlp.*"]
 
+# Precompiled layouts for the fixed-format parts of each Art-Net frame. Offsets
+# used with unpack_from are relative to the end of the opcode, ie. data[10:]
+_OPCODE = struct.Struct("<H")
+_POLL_HDR = struct.Struct(">HBB")
+_POLL = struct.Struct("<HBBBB")
+_PR_HDR = struct.Struct("<IHHBBH")
+_PR_NAME = struct.Struct("<BBH18s")
+_PR_LONG = struct.Struct("<64s64sH")
+_PR_PORTS = struct.Struct("<4s4s4s4s4s")
+_PR_TAIL = struct.Struct("<BBB3xB")
+_PR_EXT1 = struct.Struct("<IB")
+_PR_U8 = struct.Struct("<B")
+_PR_U16 = struct.Struct("<H")
+_PR_GOOD = struct.Struct("<4s")
+_PR_RDM = struct.Struct("<6s")
+_REPLY_FULL = struct.Struct("<HIHHBBHBBH18s64s64sBB4s4s4s4s4sBBB3xB6sIBB4sB6xHH11x")
+_DMX_RX_HDR = struct.Struct(">HBBBBH")
+_DMX_HDR = struct.Struct("<HBBBBBBH")
+
 # register a logger so that our debug can be enabled if required
 logger = logging.getLogger("aioartnet")
 
 
 # helper to de-tangle some of the protocol endianness. Fields like IP address
 # are stored as 4 consecutive bytes, but not in little-endian like the rest of the
-# protocol. Better to read as a 32-bit int in struct.unpack and then byteswap it
+# protocol. Better to read as a 32-bit int in struct.unpack and then byteswap it.
+# Where a whole layout is big-endian (or single bytes), the Struct is declared
+# with ">" instead and no swap is needed.
 def swap32(x: int) -> int:
-    return int.from_bytes(
-        x.to_bytes(4, byteorder="little"), byteorder="big", signed=False
+    return (
+        ((x & 0xFF) << 24)
+        | ((x & 0xFF00) << 8)
+        | ((x >> 8) & 0xFF00)
+        | ((x >> 24) & 0xFF)
     )
 
 
 def swap16(x: int) -> int:
-    return int.from_bytes(
-        x.to_bytes(2, byteorder="little"), byteorder="big", signed=False
-    )
+    return ((x & 0xFF) << 8) | ((x >> 8) & 0xFF)
 
 
 # The broadcast IP is used for locating nodes and managing subscriptions.
@@ -77,6 +101,20 @@ DGAddr = tuple[Union[str, Any], int]
 
 
 class ArtNetNode:
+    # nodes, ports and universes are created for every device on the network,
+    # slots keep them compact and catch attribute typos
+    __slots__ = (
+        "portName",
+        "longName",
+        "_portBinds",
+        "ports",
+        "style",
+        "udpport",
+        "ip",
+        "_send_addr",
+        "last_reply",
+    )
+
     def __init__(
         self,
         longName: str,
@@ -87,11 +125,14 @@ class ArtNetNode:
     ) -> None:
         self.portName = portName
         self.longName = longName
-        self._portBinds: defaultdict[int, list[ArtNetPort]] = defaultdict(list)
+        self._portBinds: dict[int, list[ArtNetPort]] = {}
         self.ports: list[ArtNetPort] = []
         self.style: int = style
         self.udpport = udpport
         self.ip = ip
+        # destination for unicast DMX, nodes are replaced rather than mutated
+        # when their address changes so this is built once
+        self._send_addr: DGAddr = (ip, udpport)
         self.last_reply: float = 0.0
 
     def __repr__(self) -> str:
@@ -99,31 +140,59 @@ class ArtNetNode:
 
 
 class ArtNetUniverse:
+    __slots__ = (
+        "portaddress",
+        "publishers",
+        "subscribers",
+        "last_data",
+        "_last_seq",
+        "_last_publish",
+        "publisherseq",
+        "_send_buf",
+        "_split",
+        "_repr",
+    )
+
     def __init__(self, portaddress: int):
         if portaddress > 0x7FFF:
             raise ValueError("Invalid net:subnet:universe, as net>128")
         self.portaddress = portaddress
-        self.publishers: list[ArtNetNode] = list()
-        self.subscribers: list[ArtNetNode] = list()
+        self.publishers: set[ArtNetNode] = set()
+        self.subscribers: set[ArtNetNode] = set()
         self.last_data = bytearray(DMX_UNIVERSE_SIZE)
         self._last_seq = 1
         self._last_publish: float = 0.0
         self.publisherseq: dict[Tuple[DGAddr, int], int] = {}
+        # outgoing ArtDmx frame, reused for every subscriber of every publish.
+        # last_data stays a separate bytearray so callers can keep assigning
+        # lists etc. to it, and is copied in once per publish
+        self._send_buf = bytearray(ARTNET_PREFIX + bytes(10 + DMX_UNIVERSE_SIZE))
 
-    def split(self) -> Tuple[int, int, int]:
+        # portaddress is fixed for the life of the universe, so its split form
+        # and repr (used in most log lines) are computed once
         # name  net:sub_net:universe
         # bits  8:15  4:8     0:4
-        net = self.portaddress >> 8
-        sub_net = (self.portaddress >> 4) & 0x0F
-        universe = self.portaddress & 0x0F
-        return net, sub_net, universe
+        net = portaddress >> 8
+        sub_net = (portaddress >> 4) & 0x0F
+        universe = portaddress & 0x0F
+        self._split = (net, sub_net, universe)
+        self._repr = f"{net}:{sub_net}:{universe}"
+
+    def split(self) -> Tuple[int, int, int]:
+        return self._split
 
     def __repr__(self) -> str:
-        net, sub_net, universe = self.split()
-        return f"{net}:{sub_net}:{universe}"
+        return self._repr
+
+
+# names for the protocol field of PortTypes, and for port direction by isinput
+_MEDIA_NAMES = ("DMX", "MIDI", "Avab", "Colortran CMX", "ADB 62.5", "Art-Net", "DALI")
+_DIR_NAMES = ("Output", "Input")
 
 
 class ArtNetPort:
+    __slots__ = ("node", "isinput", "media", "portaddr", "universe")
+
     def __init__(
         self,
         node: Union[ArtNetNode, "ArtNetClient"],
@@ -138,11 +207,23 @@ class ArtNetPort:
         self.portaddr = portaddr
         self.universe = universe
 
+    # ports are compared by what they bind, so an unchanged port seen again in
+    # a later PollReply matches the one we already hold
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArtNetPort):
+            return NotImplemented
+        return (self.node, self.isinput, self.portaddr) == (
+            other.node,
+            other.isinput,
+            other.portaddr,
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.node), self.isinput, self.portaddr))
+
     def __repr__(self) -> str:
-        inout = {True: "Input", False: "Output"}[self.isinput]
-        media = ["DMX", "MIDI", "Avab", "Colortran CMX", "ADB 62.5", "Art-Net", "DALI"][
-            self.media
-        ]
+        inout = _DIR_NAMES[self.isinput]
+        media = _MEDIA_NAMES[self.media]
         return f"Port<{inout},{media},{self.universe}>"
 
 
@@ -151,6 +232,8 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
         self.client = client
         self.transport: Optional[asyncio.DatagramTransport] = None
         self._last_poll = 0.0
+        # a small int-keyed dict is already the cheapest dispatch in CPython,
+        # measured faster than a table indexed by opcode >> 12
         self.handlers = {
             0x2000: self.on_art_poll,
             0x2100: self.on_art_poll_reply,
@@ -158,42 +241,49 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
         }
         client.protocol = self
         self.node_report_counter = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._reply_bufs: dict[int, bytearray] = {}
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self.transport = cast(asyncio.DatagramTransport, transport)
         sock = transport.get_extra_info("socket")
         if sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+            except OSError as e:
+                logger.debug(f"unable to set SO_RCVBUF: {e}")
 
     def datagram_received(self, data: bytes, addr: DGAddr) -> None:
-        if data[0:8] == ARTNET_PREFIX:
-            (opcode,) = struct.unpack("H", data[8:10])
+        if data.startswith(ARTNET_PREFIX):
+            (opcode,) = _OPCODE.unpack_from(data, 8)
             h = self.handlers.get(opcode, None)
             if h:
-                h(addr, data[10:])
-            else:
+                # handlers get a view of the body rather than a copy of it
+                h(addr, memoryview(data)[10:])
+            elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"Received unsupported Art-Net: op {hex(opcode)} from {addr}: {data[10:]!r}"
                 )
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Received non Art-Net data from {addr}: {data!r}")
 
-    def on_art_poll(self, addr: DGAddr, data: bytes) -> None:
-        ver, flags, priority = struct.unpack("<HBB", data)
-        ver = swap16(ver)
-        logger.debug(
-            f"Received Art-Net Poll: ver {ver} flags {flags} prio: {priority} from {addr}"
-        )
+    def on_art_poll(self, addr: DGAddr, data: memoryview) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            ver, flags, priority = _POLL_HDR.unpack_from(data, 0)
+            logger.debug(
+                f"Received Art-Net Poll: ver {ver} flags {flags} prio: {priority} from {addr}"
+            )
         self.send_art_poll_reply()
 
-    def on_art_poll_reply(self, addr: DGAddr, data: bytes) -> None:
+    def on_art_poll_reply(self, addr: DGAddr, data: memoryview) -> None:
         # everything up to the mac address field is mandatory, the rest must be
         # parsed only if it is sent (field at a time)
-        ip, port, fw, netsw, subsw, oemCode = struct.unpack("<IHHBBH", data[0:12])
-        ubeaVer, status, esta, portName = struct.unpack("<BBH18s", data[12:34])
-        longName, report, numports = struct.unpack("<64s64sH", data[34:164])
-        ptype, ins, outs, swin, swout = struct.unpack("<4s4s4s4s4s", data[164:184])
-        acnprio, swmacro, swremote, style = struct.unpack("<BBB3xB", data[184:191])
+        ip, port, fw, netsw, subsw, oemCode = _PR_HDR.unpack_from(data, 0)
+        ubeaVer, status, esta, portName = _PR_NAME.unpack_from(data, 12)
+        longName, report, numports = _PR_LONG.unpack_from(data, 34)
+        ptype, ins, outs, swin, swout = _PR_PORTS.unpack_from(data, 164)
+        acnprio, swmacro, swremote, style = _PR_TAIL.unpack_from(data, 184)
         # mac = struct.unpack("<6s", data[191:197])
 
         bindip = 0
@@ -205,39 +295,40 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
         user = 0
         refresh = 0
         if len(data) >= 202:
-            bindip, bindindex = struct.unpack("<IB", data[197:202])
+            bindip, bindindex = _PR_EXT1.unpack_from(data, 197)
         if len(data) >= 203:
-            (status2,) = struct.unpack("<B", data[202:203])
+            (status2,) = _PR_U8.unpack_from(data, 202)
         if len(data) >= 207:
-            (goodout,) = struct.unpack("<4s", data[203:207])
+            (goodout,) = _PR_GOOD.unpack_from(data, 203)
         if len(data) >= 208:
-            (status3,) = struct.unpack("<B", data[207:208])
+            (status3,) = _PR_U8.unpack_from(data, 207)
         if len(data) >= 216:
-            (rdm,) = struct.unpack("<6s", data[210:216])
+            (rdm,) = _PR_RDM.unpack_from(data, 210)
         if len(data) >= 218:
-            (user,) = struct.unpack("<H", data[216:218])
+            (user,) = _PR_U16.unpack_from(data, 216)
         if len(data) >= 220:
-            (refresh,) = struct.unpack("<H", data[218:220])
+            (refresh,) = _PR_U16.unpack_from(data, 218)
 
         # post process
         portName = portName.rstrip(b"\000").decode()
         longName = longName.rstrip(b"\000").decode()
 
-        ipa = ipaddress.IPv4Address(swap32(ip))
-
         nn = self.client.nodes.get(ip, None)
         changed = False
         if nn is not None:
             changed |= nn.longName != longName
             changed |= nn.portName != portName
             changed |= nn.style != style
-            logger.debug(f"change detection on {nn} => {changed}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"change detection on {nn} => {changed}")
 
         # FIXME: what if a node changes ip address?
 
         if nn is None or changed:
+            # the IpAddress field is in network order, format it straight
+            # from the packet rather than byteswapping our int key
             newnode = ArtNetNode(
-                ip=f"{ipa}",
+                ip=socket.inet_ntoa(data[0:4]),
                 udpport=port,
                 longName=longName,
                 portName=portName,
@@ -254,47 +345,52 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
 
         # iterate through the ports and create ports and universes
         portList = []
-        for _type, _in, _out, _swin, _swout in zip(ptype, ins, outs, swin, swout):
-            in_port_addr = (
-                ((netsw & 0x7F) << 8) + ((subsw & 0x0F) << 4) + (_swin & 0x0F)
-            )
-            out_port_addr = (
-                ((netsw & 0x7F) << 8) + ((subsw & 0x0F) << 4) + (_swout & 0x0F)
-            )
+        # net and sub-net are common to every port on this bind page
+        page_addr = ((netsw & 0x7F) << 8) + ((subsw & 0x0F) << 4)
+        for i in range(4):
+            _type = ptype[i]
+            if not _type & 0b11000000:
+                continue
             if _type & 0b10000000:
+                out_port_addr = page_addr + (swout[i] & 0x0F)
                 outu = self.client._get_create_universe(out_port_addr)
                 portList.append(
                     ArtNetPort(nn, False, _type & 0x1F, out_port_addr, outu)
                 )
             if _type & 0b01000000:
+                in_port_addr = page_addr + (swin[i] & 0x0F)
                 inu = self.client._get_create_universe(in_port_addr)
                 portList.append(ArtNetPort(nn, True, _type & 0x1F, in_port_addr, inu))
 
-        # track which 'pages' of port bindings we have seen
-        old_ports = nn._portBinds[bindindex]
-        for p in portList:
-            if p not in old_ports:
+        # track which 'pages' of port bindings we have seen. A page may list
+        # the same universe on several ports, keep one entry per distinct port
+        # so that dropping it later removes it (and the node) completely
+        old_ports = nn._portBinds.setdefault(bindindex, [])
+        old_set = set(old_ports)
+        new_ports = dict.fromkeys(portList)
+        for p in new_ports:
+            if p not in old_set:
                 nn.ports.append(p)
-                nn._portBinds[bindindex].append(p)
+                old_ports.append(p)
                 {True: p.universe.publishers, False: p.universe.subscribers}[
                     p.isinput
-                ].append(nn)
+                ].add(nn)
 
-        for p in list(old_ports):
-            if p not in portList:
-                nn.ports.remove(p)
-                nn._portBinds[bindindex].remove(p)
+        for p in old_set.difference(new_ports):
+            nn.ports.remove(p)
+            old_ports.remove(p)
+            # another bind page may still carry the same universe
+            if p not in nn.ports:
                 {True: p.universe.publishers, False: p.universe.subscribers}[
                     p.isinput
-                ].remove(nn)
-        logger.debug(
-            f"Received Art-Net PollReply from {ip} fw {fw} portName {portName} longName: {longName} bindindex {bindindex} ports:{portList}"
-        )
+                ].discard(nn)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Received Art-Net PollReply from {ip} fw {fw} portName {portName} longName: {longName} bindindex {bindindex} ports:{portList}"
+            )
 
-    def on_art_dmx(self, addr: DGAddr, data: bytes) -> None:
-        ver, seq, phys, sub, net, chlen = struct.unpack("<HBBBBH", data[0:8])
-        ver = swap16(ver)
-        chlen = swap16(chlen)
+    def on_art_dmx(self, addr: DGAddr, data: memoryview) -> None:
+        ver, seq, phys, sub, net, chlen = _DMX_RX_HDR.unpack_from(data, 0)
         portaddress = sub + (net << 8)
 
         # check enabled flag as a ~40Hz frequency message
@@ -329,24 +425,43 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
         # TODO: HTP/LTP merging with Merge Mode, see "Data Merging" spec p61
         # See ArtAddress AcCancelMerge flags spec p39
         # Only two sources are allowed to contribute to the values in the universe
+        # data is a memoryview of the received datagram, so this copies once
         u.last_data[0:chlen] = data[8 : 8 + chlen]
 
     async def art_poll_task(self) -> None:
+        # created here rather than __init__ so it belongs to the running loop
+        self._wakeup = asyncio.Event()
         while True:
-            await asyncio.sleep(0.1)
             t = time.time()
 
             for u in self.client._publishing:
-                if t > u._last_publish + 1.0:
+                if t >= u._last_publish + 1.0:
                     self._send_art_dmx(u)
 
-            if t > self._last_poll + 2.0:
+            if t >= self._last_poll + 2.0:
                 self._send_art_poll()
 
+            # sleep until the next refresh or poll falls due, rather than
+            # ticking. wake() cuts this short if the publishing set changes
+            deadline = self._last_poll + 2.0
+            for u in self.client._publishing:
+                deadline = min(deadline, u._last_publish + 1.0)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), max(0.0, deadline - time.time())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def wake(self) -> None:
+        if self._wakeup:
+            self._wakeup.set()
+
     def _send_art_poll(self) -> None:
         self._last_poll = time.time()
         self.node_report_counter = (self.node_report_counter + 1) % 10000
-        message = ARTNET_PREFIX + struct.pack("<HBBBB", 0x2000, 0, 14, 2, 16)
+        message = ARTNET_PREFIX + _POLL.pack(0x2000, 0, 14, 2, 16)
         logger.debug(f"sending poll to {self.client.broadcast_ip}")
         if self.transport:
             self.transport.sendto(message, addr=(self.client.broadcast_ip, ARTNET_PORT))
@@ -354,19 +469,49 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
     def _send_art_dmx(self, u: ArtNetUniverse) -> None:
         u._last_publish = time.time()
         u._last_seq = (u._last_seq + 1) % 255
-        logger.debug(f"send_art_dmx {u} to {u.subscribers}")
+        # check enabled flag as these run for every publish
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"send_art_dmx {u} to {u.subscribers}")
+        # the frame is identical for every subscriber, so build it once
+        _DMX_HDR.pack_into(
+            u._send_buf,
+            8,
+            0x5000,
+            0,
+            14,
+            1 + u._last_seq,
+            0,
+            u.portaddress & 0xFF,
+            u.portaddress >> 8,
+            swap16(DMX_UNIVERSE_SIZE),
+        )
+        u._send_buf[18:] = u.last_data
+
+        if not self.transport:
+            return
+        # _send_buf is rewritten in place on the next publish. That relies on
+        # the stdlib selector transport, which copies (bytes(data)) anything
+        # it cannot send immediately. The DatagramTransport interface does not
+        # promise this, so a loop that queues a reference could send later data
         for s in u.subscribers:
-            self._send_art_dmx_subscriber(u, s, u._last_seq)
+            self.transport.sendto(u._send_buf, addr=s._send_addr)
 
     def send_art_poll_reply(self) -> None:
+        if not self.client.unicast_ip:
+            return
+        addr = (self.client.broadcast_ip, ARTNET_PORT)
+        # sent in answer to every ArtPoll received, so check the enabled flag
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"sending poll reply to {addr}")
+        if not self.transport:
+            return
         for bi, p in self.client._portBinds.items():
-            self._send_art_poll_reply_bindindex(bi, p)
+            self.transport.sendto(self._build_art_poll_reply(bi, p), addr=addr)
 
-    def _send_art_poll_reply_bindindex(
+    def _build_art_poll_reply(
         self, bindindex: int, ports: list[ArtNetPort]
-    ) -> None:
-        if not self.client.unicast_ip:
-            return
+    ) -> bytearray:
+        assert self.client.unicast_ip is not None
         ip = int.from_bytes(
             socket.inet_aton(self.client.unicast_ip), byteorder="little", signed=False
         )
@@ -400,8 +545,15 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
 
         nodereport = f"#0001 [{self.node_report_counter:04d}] Debug OK".encode()
 
-        data = ARTNET_PREFIX + struct.pack(
-            "<HIHHBBHBBH18s64s64sBB4s4s4s4s4sBBB3xB6sIBB4sB6xHH11x",
+        # one persistent frame per bind page, repacked in place each time. As
+        # with ArtDmx this relies on the selector transport copying any frame
+        # it has to queue, see _send_art_dmx
+        if (data := self._reply_bufs.get(bindindex)) is None:
+            data = bytearray(ARTNET_PREFIX + bytes(_REPLY_FULL.size))
+            self._reply_bufs[bindindex] = data
+        _REPLY_FULL.pack_into(
+            data,
+            8,
             0x2100,
             ip,
             ARTNET_PORT,
@@ -435,34 +587,7 @@ class ArtNetClientProtocol(asyncio.DatagramProtocol):
             user,
             refresh,
         )
-        addr = (self.client.broadcast_ip, ARTNET_PORT)
-        logger.debug(f"sending poll reply to {addr}")
-        if self.transport:
-            self.transport.sendto(data, addr=addr)
-
-    def _send_art_dmx_subscriber(
-        self, universe: ArtNetUniverse, node: ArtNetNode, seq: int
-    ) -> None:
-        subuni = universe.portaddress & 0xFF
-        net = universe.portaddress >> 8
-        message = ARTNET_PREFIX + struct.pack(
-            "<HBBBBBBH",
-            0x5000,
-            0,
-            14,
-            1 + seq,
-            0,
-            subuni,
-            net,
-            swap16(DMX_UNIVERSE_SIZE),
-        )
-        message = message + universe.last_data
-
-        logger.debug(
-            f"sending dmx for {universe} to {node} at {node.ip}:{node.udpport}"
-        )
-        if self.transport:
-            self.transport.sendto(message, addr=(node.ip, node.udpport))
+        return data
 
     def error_received(self, exc: Exception) -> None:
         logger.warn("Error received:", exc)
@@ -490,6 +615,8 @@ class ArtNetClient:
         self.net = 0
         self.subnet = 0
         self.ports: list[ArtNetPort] = []
+        # index of self.ports by port address, at most one own port per universe
+        self._ports_by_universe: dict[int, ArtNetPort] = {}
         self._portBinds: dict[int, list[ArtNetPort]] = {1: []}
         self._portName = portName
         self._longName = f"{portName} (aioartnet)"
@@ -502,7 +629,7 @@ class ArtNetClient:
         self.mac: bytes = b"\01\22\33\44\55\66"
 
         self.protocol: Optional[ArtNetClientProtocol] = None
-        self._publishing: list[ArtNetUniverse] = []
+        self._publishing: set[ArtNetUniverse] = set()
         self.interface: Optional[str] = interface
         self._task: Optional[asyncio.Task[None]] = None
 
@@ -550,8 +677,12 @@ class ArtNetClient:
 
         if u not in self._publishing:
             raise ValueError(f"No input port configured for {u}")
+        if len(data) > DMX_UNIVERSE_SIZE:
+            raise ValueError(f"DMX data for {u} exceeds {DMX_UNIVERSE_SIZE} channels")
 
-        u.last_data[:] = data[:]
+        # copy in place, a short write updates the leading channels and keeps
+        # last_data (and the frames we send) at the full universe size
+        u.last_data[: len(data)] = data
         if self.protocol:
             self.protocol._send_art_dmx(u)
 
@@ -562,6 +693,10 @@ class ArtNetClient:
         self.nodes[ip] = node
 
     def _parse_universe(self, universe: UniverseKey) -> int:
+        # fast path for streaming set_dmx by port address, subclasses of int
+        # and out of range values take the checked route below
+        if type(universe) is int and universe <= 0x7FFF:
+            return universe
         if isinstance(universe, str):
             # parse to int
             net, sub, univ = map(int, universe.split(":"))
@@ -585,12 +720,7 @@ class ArtNetClient:
         # port objects within client.ports all have node=None, this is the template
         # for the publisher. client.nodes[ownip].ports[] *should* contain the same
         # information once we process our own replies.
-        port = None
-        for i, p in enumerate(self.ports):
-            if p.universe == u:
-                logger.debug(f"set_port_config: has existing port {p}")
-                port = p
-                break
+        port = self._ports_by_universe.pop(port_addr, None)
         if port:
             self.ports.remove(port)
             logger.info(f"removed own port {port}")
@@ -600,6 +730,7 @@ class ArtNetClient:
                 node=self, isinput=isinput, media=0, portaddr=port_addr, universe=u
             )
             self.ports.append(port)
+            self._ports_by_universe[port_addr] = port
             logger.info(f"configured own port {port}")
 
         # TODO: optimise the layour of self.ports to self._portBinds
@@ -611,13 +742,15 @@ class ArtNetClient:
             self._portBinds = {1: []}
 
         # used for the timer-based DMX repeating
-        if u in self._publishing:
-            self._publishing.remove(u)
+        self._publishing.discard(u)
         if isinput:
-            self._publishing.append(u)
+            self._publishing.add(u)
 
-        if not self.passive and self.protocol:
-            self.protocol.send_art_poll_reply()
+        if self.protocol:
+            # let the timer pick up a new (or dropped) publishing deadline
+            self.protocol.wake()
+            if not self.passive:
+                self.protocol.send_art_poll_reply()
 
         return u
 
@@ -1,20 +1,21 @@
 import ctypes.util
 import logging
 import os
-import socket
+import time
 from ctypes import (
     CDLL,
     POINTER,
     Structure,
+    byref,
     c_char_p,
     c_int,
     c_uint,
     c_uint8,
     c_void_p,
-    pointer,
 )
+from socket import AF_INET, AF_INET6, inet_ntop
 from sys import platform
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # return MAC addresses under our own constant, because
 # on macos socket.AF_PACKET is not defined, and the value
@@ -49,8 +50,11 @@ class Ifaddrs(Structure):
     pass
 
 
+# ifaddrs is self-referential: declare the pointer type once, up front, then
+# complete the structure with a single _fields_ assignment
+PIfaddrs = POINTER(Ifaddrs)
 Ifaddrs._fields_ = [
-    ("ifa_next", POINTER(Ifaddrs)),
+    ("ifa_next", PIfaddrs),
     ("ifa_name", c_char_p),
     ("ifa_flags", c_uint),
     ("ifa_addr", POINTER(Sockaddr)),
@@ -59,67 +63,156 @@ Ifaddrs._fields_ = [
     ("ifa_data", c_void_p),
 ]
 
+# load libc once, rather than searching for and loading it on every call
+_LIBC = CDLL(
+    ctypes.util.find_library("socket" if os.uname()[0] == "SunOS" else "c"),
+    use_errno=True,
+)
+_GETIFADDRS = _LIBC.getifaddrs
+_GETIFADDRS.restype = c_int
+_GETIFADDRS.argtypes = [POINTER(PIfaddrs)]
+_FREEIFADDRS = _LIBC.freeifaddrs
+_FREEIFADDRS.restype = None
+_FREEIFADDRS.argtypes = [PIfaddrs]
+
+
+# decoders fill in the addresses of one ifaddrs entry from its sa_data
+SaData = Optional[memoryview]
+Decoder = Callable[[Dict[str, Any], SaData, SaData, SaData], None]
+
+
+def _decode_inet(
+    d: Dict[str, Any], addr: SaData, netmask: SaData, broadaddr: SaData
+) -> None:
+    if addr:
+        d["addr"] = inet_ntop(AF_INET, addr[2:6])
+    if netmask:
+        d["netmask"] = inet_ntop(AF_INET, netmask[2:6])
+    if broadaddr:
+        d["broadaddr"] = inet_ntop(AF_INET, broadaddr[2:6])
+
+
+def _decode_inet6(
+    d: Dict[str, Any], addr: SaData, netmask: SaData, broadaddr: SaData
+) -> None:
+    if addr:
+        d["addr"] = inet_ntop(AF_INET6, addr[6:22])
+    if netmask:
+        d["netmask"] = inet_ntop(AF_INET6, netmask[6:22])
+
+
+def _decode_linux_mac(
+    d: Dict[str, Any], addr: SaData, netmask: SaData, broadaddr: SaData
+) -> None:
+    if addr:
+        d["addr"] = addr[10:16].hex()
+    if broadaddr:
+        d["broadaddr"] = broadaddr[10:16].hex()
+
+
+def _decode_macos_mac(
+    d: Dict[str, Any], addr: SaData, netmask: SaData, broadaddr: SaData
+) -> None:
+    if addr:
+        d["addr"] = addr[9:15].hex()
+
+
+# sa_family -> (family the entry is reported and filtered under, decoder)
+_AF_DECODERS: Dict[int, Tuple[int, Decoder]] = {
+    AF_INET: (AF_INET, _decode_inet),
+    AF_INET6: (AF_INET6, _decode_inet6),
+    17: (AF_PACKET, _decode_linux_mac),  # linux MAC addr
+    18: (AF_PACKET, _decode_macos_mac),  # macos MAC addr
+}
+
+
+def _reported_family(fam: int) -> int:
+    # the family an entry is reported and filtered under, see _AF_DECODERS
+    return _AF_DECODERS.get(fam, (fam, None))[0]
+
+
+# interfaces change on a human timescale, so back-to-back lookups (eg. the
+# AF_INET and AF_PACKET queries made during connect) share one walk of the
+# unfiltered list, and each call filters its own view of it
+GETIFADDRS_TTL = 0.5
+_getifaddrs_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
 
 def getifaddrs(
     ifname: Optional[str] = None, family: Optional[int] = None
 ) -> List[Dict[str, Any]]:
-    libc = CDLL(
-        ctypes.util.find_library("socket" if os.uname()[0] == "SunOS" else "c"),
-        use_errno=True,
-    )
-    libc.getifaddrs.restype = c_int
-    ifaddr_p = pointer(Ifaddrs())
-    ret = libc.getifaddrs(pointer((ifaddr_p)))
+    global _getifaddrs_cache
+    now = time.monotonic()
+    hit = _getifaddrs_cache
+    if hit is None or now - hit[0] >= GETIFADDRS_TTL:
+        hit = _getifaddrs_cache = (now, list(iter_ifaddrs()))
+    # callers are free to modify what they get back
+    return [
+        dict(d)
+        for d in hit[1]
+        if (ifname is None or ifname in d["name"])
+        and (family is None or _reported_family(d["family"]) == family)
+    ]
+
+
+def iter_ifaddrs(
+    ifname: Optional[str] = None, family: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Uncached, lazy version of getifaddrs, yielding each entry as it is decoded
+    :param ifname: only entries whose interface name contains this
+    :param family: only entries of this address family
+    """
+    # getifaddrs fills in our (initially NULL) list pointer
+    ifaddr_p = PIfaddrs()
+    ret = _GETIFADDRS(byref(ifaddr_p))
     if ret != 0:
         raise ValueError("getifaddrs nonzero return code")
-    addrs = []
-    head = ifaddr_p
+    try:
+        yield from _walk_ifaddrs(ifaddr_p, ifname, family)
+    finally:
+        # runs even if the caller stops iterating early
+        _FREEIFADDRS(ifaddr_p)
+
+
+def _walk_ifaddrs(
+    ifaddr_p: Any, ifname: Optional[str], family: Optional[int]
+) -> Iterator[Dict[str, Any]]:
+    # local lookups for the per-entry loop
+    get_decoder = _AF_DECODERS.get
     while ifaddr_p:
-        name = str(ifaddr_p.contents.ifa_name.decode())
+        # each .contents builds a new Structure view, so take one per entry
+        cur = ifaddr_p.contents
+        ifaddr_p = cur.ifa_next
+
+        # filter before decoding anything, most entries are usually skipped
+        name = str(cur.ifa_name.decode())
+        if ifname is not None and ifname not in name:
+            continue
+        # interfaces with no address at all (eg. some tun devices) have a
+        # NULL ifa_addr, there is nothing to report for them
+        if not cur.ifa_addr:
+            continue
+        sa = cur.ifa_addr.contents
+        fam = sa.sa_family
+        reported, decode = get_decoder(fam, (fam, None))
+        if family is not None and reported != family:
+            continue
+
         netmask = None
         broadaddr = None
-        addr = None
-        fam = ifaddr_p.contents.ifa_addr.contents.sa_family
         d = {"name": name, "family": fam}
-        if ifaddr_p.contents.ifa_broadaddr:
-            broadaddr = bytes(ifaddr_p.contents.ifa_broadaddr.contents.sa_data)
-        if ifaddr_p.contents.ifa_netmask:
-            netmask = bytes(ifaddr_p.contents.ifa_netmask.contents.sa_data)
-        if ifaddr_p.contents.ifa_addr:
-            addr = bytes(ifaddr_p.contents.ifa_addr.contents.sa_data)
-
-        if fam == socket.AF_INET:
-            if addr:
-                d["addr"] = socket.inet_ntoa(addr[2:6])
-            if netmask:
-                d["netmask"] = socket.inet_ntoa(netmask[2:6])
-            if broadaddr:
-                d["broadaddr"] = socket.inet_ntoa(broadaddr[2:6])
-        elif fam == socket.AF_INET6:
-            if addr:
-                d["addr"] = socket.inet_ntop(fam, addr[6:22])
-            if netmask:
-                d["netmask"] = socket.inet_ntop(fam, netmask[6:22])
-        elif fam == 17:  # linux MAC addr
-            if addr:
-                d["addr"] = addr[10:16].hex()
-            if broadaddr:
-                d["broadaddr"] = broadaddr[10:16].hex()
-            fam = AF_PACKET
-        elif fam == 18:  # macos MAC addr
-            if addr:
-                d["addr"] = addr[9:15].hex()
-            fam = AF_PACKET
+        # views straight onto libc's sockaddrs, valid until freeifaddrs
+        addr = memoryview(sa.sa_data)
+        if cur.ifa_broadaddr:
+            broadaddr = memoryview(cur.ifa_broadaddr.contents.sa_data)
+        if cur.ifa_netmask:
+            netmask = memoryview(cur.ifa_netmask.contents.sa_data)
+
+        if decode:
+            decode(d, addr, netmask, broadaddr)
         logging.debug(f"getifaddrs {d}")
-
-        ifaddr_p = ifaddr_p.contents.ifa_next
-
-        if ifname is None or ifname in name:
-            if family is None or fam == family:
-                addrs.append(d)
-
-    libc.freeifaddrs(head)
-    return addrs
+        yield d
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import asyncio
+import mmap
 import socket
 import struct
 from asyncio import BaseTransport
@@ -10,8 +12,21 @@ from aioartnet import (
     DMX_UNIVERSE_SIZE,
     ArtNetClient,
     ArtNetUniverse,
+    network,
 )
-from aioartnet.aio_artnet import ArtNetClientProtocol, DGAddr
+from aioartnet.aio_artnet import (
+    ArtNetClientProtocol,
+    ArtNetPort,
+    DGAddr,
+    get_iface_ip,
+    get_preferred_artnet_interface,
+    swap16,
+    swap32,
+)
+from aioartnet.network import AF_PACKET, getifaddrs
+
+# a full universe of distinct-ish channel values, built once
+TEST_PATTERN = bytes(range(128)) * 4
 
 
 def test_universe() -> None:
@@ -25,26 +40,46 @@ def test_universe() -> None:
         ArtNetUniverse(0x8FFF)  # only 128 'nets'
 
 
+def test_swap() -> None:
+    assert swap16(0x0002) == 0x0200
+    assert swap16(0x1234) == 0x3412
+    assert swap32(0x0A0A0A0A) == 0x0A0A0A0A
+    assert swap32(0xDE01A8C0) == 0xC0A801DE
+    assert swap32(swap32(0x12345678)) == 0x12345678
+
+
+# libpcap file and record headers, and the UDP port field of a captured frame
+_PCAP_GLOBAL = struct.Struct("<IHH8xII")
+_PCAP_REC = struct.Struct("<IIII")
+_UDP_PORT = struct.Struct(">H")
+
+
 def packet_reader(file: str) -> Iterator[Tuple[float, bytes]]:
+    # map the whole capture and walk it in place, one read per record
     with open(file, "rb") as f:
-        magic, verMaj, verMin, snaplen, netw = struct.unpack("<IHH8xII", f.read(24))
-        print(f"pcap {file} magic {hex(magic)} ver {verMaj}.{verMin} link layer {netw}")
-
-        # magic written as 0xa1b2c3d4 in native order
-        # magic reads as 0xa1b2c3d4 => we are usec, good
-        # magic reads as 0xd4c3b2a1 => we are usec, byte-swapped
-        # magic reads as 0xa1b23c4d => nanos
-        assert magic == 0xA1B2C3D4
-        timediv = 1000000.0
-        while True:
-            hdr = f.read(16)
-            if len(hdr) == 0:
-                return
-            tsec, tusec, filesz, wiresz = struct.unpack("<IIII", hdr)
-            time = tsec + tusec / timediv
-            # print(f" pkt {time} {filesz} {wiresz}")
-            packet = f.read(filesz)
-            yield time, packet
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mm, memoryview(mm) as mv:
+            magic, verMaj, verMin, snaplen, netw = _PCAP_GLOBAL.unpack_from(mv, 0)
+            print(
+                f"pcap {file} magic {hex(magic)} ver {verMaj}.{verMin} link layer {netw}"
+            )
+
+            # magic written as 0xa1b2c3d4 in native order
+            # magic reads as 0xa1b2c3d4 => we are usec, good
+            # magic reads as 0xd4c3b2a1 => we are usec, byte-swapped
+            # magic reads as 0xa1b23c4d => nanos
+            assert magic == 0xA1B2C3D4
+            timediv = 1000000.0
+            off = _PCAP_GLOBAL.size
+            end = len(mv)
+            while off < end:
+                tsec, tusec, filesz, wiresz = _PCAP_REC.unpack_from(mv, off)
+                time = tsec + tusec / timediv
+                # print(f" pkt {time} {filesz} {wiresz}")
+                off += _PCAP_REC.size
+                # copy out, the mapping is closed once the capture is consumed
+                yield time, bytes(mv[off : off + filesz])
+                off += filesz
 
 
 class MockTransport(BaseTransport):
@@ -72,7 +107,7 @@ def test_artnet_poll_reply() -> None:
     for _, pkt in packet_reader("test/artnet-nodes.pcap"):
         udp = pkt[42:]
         ip = socket.inet_ntoa(pkt[26:30])
-        (port,) = struct.unpack(">H", pkt[34:36])
+        (port,) = _UDP_PORT.unpack_from(pkt, 34)
         print(f"UDP ip {ip}:{port} data {udp!r}")
         # package up the sending address as a tuple like asyncio
         proto.datagram_received(udp, (ip, port))
@@ -153,10 +188,14 @@ class BroadcastTransport(BaseTransport):
         self.pending.append((data, addr))
 
     def drain(self) -> None:
+        protos = self.protos
         while self.pending:
-            msg = self.pending.popleft()
-            for p in self.protos:
-                p.datagram_received(*msg)
+            # take the queued batch, anything sent while delivering it (eg.
+            # replies) lands in a fresh deque and is drained next time round
+            batch, self.pending = self.pending, deque()
+            for msg in batch:
+                for p in protos:
+                    p.datagram_received(*msg)
 
 
 @pytest.mark.asyncio
@@ -226,8 +265,8 @@ async def test_ports() -> None:
     # check the *recieved* view of the same packets match
     assert str(list(clA.nodes.values())[0].ports) == "[Port<Input,DMX,1:0:7>]"
     assert list(clA.universes.keys()) == [263]
-    assert str(clA.universes[263].publishers) == "[ArtNetNode<alpha,10.10.10.10:6454>]"
-    assert clA.universes[263].subscribers == []
+    assert str(clA.universes[263].publishers) == "{ArtNetNode<alpha,10.10.10.10:6454>}"
+    assert clA.universes[263].subscribers == set()
 
     # disable existing, add an output port
     clA.set_port_config("1:0:7")
@@ -237,19 +276,52 @@ async def test_ports() -> None:
     assert str(clA._portBinds) == "{1: [Port<Output,DMX,0:1:8>]}"
     assert str(list(clA.nodes.values())[0].ports) == "[Port<Output,DMX,0:1:8>]"
 
-    assert clA.universes[263].publishers == []
-    assert clA.universes[263].subscribers == []
+    assert clA.universes[263].publishers == set()
+    assert clA.universes[263].subscribers == set()
     print(clA.universes)
-    assert clA.universes[24].publishers == []
-    assert str(clA.universes[24].subscribers) == "[ArtNetNode<alpha,10.10.10.10:6454>]"
+    assert clA.universes[24].publishers == set()
+    assert str(clA.universes[24].subscribers) == "{ArtNetNode<alpha,10.10.10.10:6454>}"
 
     # two ports active at once
     clA.set_port_config("0:1:9", isinput=True)
     transport.drain()
-    assert clA.universes[24].publishers == []
-    assert str(clA.universes[24].subscribers) == "[ArtNetNode<alpha,10.10.10.10:6454>]"
-    assert str(clA.universes[25].publishers) == "[ArtNetNode<alpha,10.10.10.10:6454>]"
-    assert str(clA.universes[25].subscribers) == "[]"
+    assert clA.universes[24].publishers == set()
+    assert str(clA.universes[24].subscribers) == "{ArtNetNode<alpha,10.10.10.10:6454>}"
+    assert str(clA.universes[25].publishers) == "{ArtNetNode<alpha,10.10.10.10:6454>}"
+    assert clA.universes[25].subscribers == set()
+
+    # a repeated PollReply with unchanged ports keeps the existing port objects
+    ports = list(list(clA.nodes.values())[0].ports)
+    protoA._send_art_poll()
+    transport.drain()
+    node_ports = list(clA.nodes.values())[0].ports
+    assert all(a is b for a, b in zip(ports, node_ports))
+    assert len(node_ports) == 2
+
+
+def test_ports_duplicate_universe() -> None:
+    # a bind page may carry the same universe on more than one port, dropping
+    # them later must clean the node out of the universe completely
+    clA = ArtNetClient(interface="dummy", portName="alpha")
+    clA.unicast_ip = "10.10.10.10"
+    protoA = ArtNetClientProtocol(clA)
+    clB = ArtNetClient(interface="dummy", portName="beta")
+    protoB = ArtNetClientProtocol(clB)
+    src = ("10.10.10.10", 6454)
+
+    u = clA._get_create_universe(0)
+    page = [ArtNetPort(clA, False, 0, 0, u)] * 2 + [
+        ArtNetPort(clA, False, 0, 1, clA._get_create_universe(1))
+    ]
+    protoB.datagram_received(bytes(protoA._build_art_poll_reply(1, page)), src)
+    node = list(clB.nodes.values())[0]
+    assert str(node.ports) == "[Port<Output,DMX,0:0:0>, Port<Output,DMX,0:0:1>]"
+    assert str(clB.universes[0].subscribers) == f"{{{node}}}"
+
+    protoB.datagram_received(bytes(protoA._build_art_poll_reply(1, [])), src)
+    assert node.ports == []
+    assert clB.universes[0].subscribers == set()
+    assert clB.universes[1].subscribers == set()
 
 
 @pytest.mark.asyncio
@@ -278,9 +350,99 @@ async def test_dmx_tx_rx() -> None:
     protoA._send_art_poll()
     transport.drain()
 
-    test_pattern = bytes(list(range(128)) * 4)
-    await clA.set_dmx(utx, test_pattern)
+    await clA.set_dmx(utx, TEST_PATTERN)
     assert len(transport.pending) == 1
     transport.drain()
 
-    assert urx.last_data == test_pattern
+    assert urx.last_data == TEST_PATTERN
+
+    # a short write only updates the leading channels
+    await clA.set_dmx(utx, b"\xff\xfe")
+    transport.drain()
+    assert len(utx.last_data) == DMX_UNIVERSE_SIZE
+    assert urx.last_data == b"\xff\xfe" + TEST_PATTERN[2:]
+
+    with pytest.raises(ValueError):
+        await clA.set_dmx(utx, bytes(DMX_UNIVERSE_SIZE + 1))
+
+
+@pytest.mark.asyncio
+async def test_poll_task_wakeup() -> None:
+    # the periodic task sleeps until its next deadline, configuring a new input
+    # port must wake it to publish straight away rather than after the next poll
+    clA = ArtNetClient(interface="dummy", portName="alpha")
+    clA.broadcast_ip = "10.10.10.255"
+    clA.unicast_ip = "10.10.10.10"
+
+    clB = ArtNetClient(interface="dummy", portName="bravo")
+    clB.broadcast_ip = "10.10.10.255"
+    clB.unicast_ip = "10.10.10.2"
+    clB.set_port_config("1:0:7", isoutput=True)
+
+    protoA = ArtNetClientProtocol(clA)
+    protoB = ArtNetClientProtocol(clB)
+    transport = BroadcastTransport([protoA, protoB])
+
+    task = asyncio.create_task(protoA.art_poll_task())
+    try:
+        await asyncio.sleep(0.05)
+        transport.drain()
+        assert (
+            str(clA.universes[263].subscribers) == "{ArtNetNode<bravo,10.10.10.2:6454>}"
+        )
+
+        clA.set_port_config("1:0:7", isinput=True)
+        transport.drain()
+        await asyncio.sleep(0.05)
+        opcodes = [data[8:10] for data, _ in transport.pending]
+        assert opcodes == [b"\x00\x50"]
+    finally:
+        task.cancel()
+
+
+def test_getifaddrs_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake(ifname: Any = None, family: Any = None) -> list[dict[str, Any]]:
+        calls.append((ifname, family))
+        return [
+            {"name": "lo", "family": AF_PACKET, "addr": "000000000000"},
+            {"name": "eth0", "family": AF_PACKET, "addr": "02fc00000001"},
+            {
+                "name": "lo",
+                "family": socket.AF_INET,
+                "addr": "127.0.0.1",
+                "netmask": "255.0.0.0",
+                "broadaddr": "127.0.0.1",
+            },
+            {
+                "name": "eth0",
+                "family": socket.AF_INET,
+                "addr": "10.0.0.1",
+                "netmask": "255.255.255.0",
+                "broadaddr": "10.0.0.255",
+            },
+        ]
+
+    monkeypatch.setattr(network, "iter_ifaddrs", fake)
+    monkeypatch.setattr(network, "_getifaddrs_cache", None)
+
+    # the lookups made during connect share a single walk
+    iface = get_preferred_artnet_interface()
+    assert iface == "eth0"
+    ips = get_iface_ip(iface)
+    assert ips is not None
+    assert ips["addr"] == "10.0.0.1"
+    assert ips["mac"] == "02fc00000001"
+    assert [a["name"] for a in getifaddrs(family=AF_PACKET)] == ["lo", "eth0"]
+    assert calls == [(None, None)]
+
+    # callers get copies
+    first = getifaddrs(family=socket.AF_INET)
+    first[0]["addr"] = "changed"
+    assert getifaddrs(family=socket.AF_INET)[0]["addr"] == "127.0.0.1"
+
+    # entries expire
+    monkeypatch.setattr(network, "GETIFADDRS_TTL", 0.0)
+    getifaddrs(ifname="eth0")
+    assert calls == [(None, None), (None, None)]